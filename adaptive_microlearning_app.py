@@ -1,15 +1,28 @@
 import streamlit as st
 import json
+import copy
+import hashlib
+import os
+import tempfile
+import uuid
+import numpy as np
+import pandas as pd
+try:
+    import orjson
+except ImportError:  # optional C JSON codec for the store
+    orjson = None
 from pathlib import Path
 from datetime import datetime, date
-from collections import defaultdict
+from dataclasses import dataclass, asdict
+from itertools import chain, groupby
+from operator import itemgetter
 
 DATA_FILE = Path('data_store.json')
+COMPLETED_FILE = Path('completed.jsonl')
 
 DEFAULT_STORE = {
     'settings': {'daily_mins': 15.0},
     'lectures': [],
-    'completed_courses': [],
     'streak': {'current': 0, 'last_date': None, 'minutes_today': 0.0, 'last_fatigue': 0.0},
     'recommended_sessions': [],
     'recommended_total': 0.0
@@ -17,18 +30,110 @@ DEFAULT_STORE = {
 
 SCALE = 10  # one decimal place support
 
+# One row per segment; strings live in the (titles, topics) lookups keyed by lec_idx/seg_idx
+SEGMENT_DTYPE = np.dtype([('u','i8'),('mins','f8'),('difficulty','i8'),('order','i8'),('lec_idx','i4'),('seg_idx','i4')])
+
+# Active-session segment; kept in session state across reruns, converted with asdict on completion
+@dataclass(slots=True)
+class Segment:
+    lecture_title: str
+    topic: str
+    mins: float
+    difficulty: int = 3
+    order: int = 1
+    done: bool = False
+
 # -------------------- Utilities --------------------
+def _default_store():
+    return copy.deepcopy(DEFAULT_STORE)
+
+def _encode_store(store):
+    if orjson is not None:
+        return orjson.dumps(store)
+    return json.dumps(store, separators=(',', ':')).encode()
+
+def _decode_store(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def load_store():
-    if DATA_FILE.exists():
+    store = _default_store()
+    # Streamlit re-executes this module on every rerun, so the flag lives in session state
+    if st.session_state.get('_store_ready') or DATA_FILE.exists():
         try:
-            return json.loads(DATA_FILE.read_text())
+            store = _decode_store(DATA_FILE.read_bytes())
+            st.session_state['_store_ready'] = True
+            # Seed the save debounce so an unchanged store is not rewritten
+            st.session_state['_last_hash'] = hashlib.blake2b(_encode_store(store)).digest()
         except Exception:
-            return json.loads(json.dumps(DEFAULT_STORE))
-    else:
-        return json.loads(json.dumps(DEFAULT_STORE))
+            store = _default_store()
+    # Migrate completions kept inline by older versions into the JSONL log.
+    # Records already in the log are skipped so an interrupted or concurrent
+    # migration cannot duplicate them; the inline copy is only dropped, and the
+    # store saved at once, after the append has succeeded.
+    legacy = store.get('completed_courses')
+    if legacy is not None:
+        try:
+            logged = {json.dumps(c, sort_keys=True) for c in iter_completed()}
+            append_completed(c for c in legacy if json.dumps(c, sort_keys=True) not in logged)
+        except OSError:
+            pass
+        else:
+            del store['completed_courses']
+            save_store(store)
+    # Scan the completion log once per session; later updates are incremental
+    if '_completed_set' not in st.session_state:
+        st.session_state['_completed_set'] = {(c['lecture_title'], c['topic']) for c in completed_records(store)}
+    return store
 
 def save_store(store):
-    DATA_FILE.write_text(json.dumps(store, indent=2))
+    data = _encode_store(store)
+    # Skip no-op saves
+    if hashlib.blake2b(data).digest() == st.session_state.get('_last_hash'):
+        return
+    # Unique temp name: sessions share one process and may save concurrently
+    fd, tmp = tempfile.mkstemp(dir=DATA_FILE.parent, prefix=DATA_FILE.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, DATA_FILE)
+    except Exception:
+        os.unlink(tmp)
+        raise
+    st.session_state['_store_ready'] = True
+    st.session_state['_last_hash'] = hashlib.blake2b(data).digest()
+
+def append_completed(records):
+    with COMPLETED_FILE.open('ab+') as f:
+        # Terminate a line left half-written by an interrupted append
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+        for r in records:
+            f.write((json.dumps(r) + '\n').encode())
+
+def iter_completed():
+    if not COMPLETED_FILE.exists():
+        return
+    with COMPLETED_FILE.open() as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Partial line from an interrupted append; skip it
+                continue
+
+# Logged completions plus any inline ones an older store could not migrate yet
+def completed_records(store):
+    return chain(iter_completed(), store.get('completed_courses', []))
+
+def clear_completed(store):
+    COMPLETED_FILE.unlink(missing_ok=True)
+    store.pop('completed_courses', None)
 
 def to_units(mins):
     return max(0, int(round(mins * SCALE)))
@@ -37,19 +142,36 @@ def from_units(u):
     return u / SCALE
 
 def flatten_segments(lectures):
-    items = []
+    rows, titles, topics = [], [], []
     for li, lec in enumerate(lectures):
-        for si, seg in enumerate(lec.get('segments', [])):
-            items.append({
-                'id': f'{li}-{si}',
-                'lecture_index': li,
-                'lecture_title': lec.get('title'),
-                'topic': seg.get('topic'),
-                'mins': float(seg.get('mins')),
-                'difficulty': int(seg.get('difficulty', 3)),
-                'order': int(seg.get('order', 1))
-            })
-    return items
+        segs = lec.get('segments', [])
+        titles.append(lec.get('title'))
+        topics.append([seg.get('topic') for seg in segs])
+        for si, seg in enumerate(segs):
+            rows.append((0, float(seg.get('mins')), int(seg.get('difficulty', 3)), int(seg.get('order', 1)), li, si))
+    arr = np.array(rows, dtype=SEGMENT_DTYPE)
+    # Vectorised to_units; np.rint rounds half-to-even like round()
+    arr['u'] = np.maximum(0, np.rint(arr['mins'] * SCALE))
+    return arr, titles, topics
+
+def segment_records(segs, titles, topics):
+    return [{'lecture_title': titles[li],
+             'topic': topics[li][si],
+             'mins': mins,
+             'difficulty': diff,
+             'order': order}
+            for li, si, mins, diff, order in zip(segs['lec_idx'].tolist(), segs['seg_idx'].tolist(),
+                                                 segs['mins'].tolist(), segs['difficulty'].tolist(),
+                                                 segs['order'].tolist())]
+
+def touch_lectures(store):
+    # Fresh random token rather than a counter, so concurrent sessions never reuse a key
+    store['lectures_rev'] = uuid.uuid4().hex
+
+# Keyed on lectures_rev only; the leading underscore keeps _lectures out of the cache hash
+@st.cache_data(max_entries=8)
+def _flatten_cached(_lectures, lectures_rev):
+    return flatten_segments(_lectures)
 
 def compute_fatigue(minutes_done, avg_difficulty):
     score = 0.007 * minutes_done + 0.02 * avg_difficulty
@@ -71,39 +193,72 @@ def update_streak(store, minutes_done):
     return streak
 
 # -------------------- Recommendation --------------------
-def recommend_segments(lectures, daily_mins, fatigue_score, completed_courses, selected_lectures=None):
-    items = flatten_segments(lectures)
-    if not items:
-        return [], 0.0
-
-    completed_set = {(c['lecture_title'], c['topic']) for c in completed_courses}
-    items = [it for it in items if (it['lecture_title'], it['topic']) not in completed_set]
+# Returns the indices of a subset whose weight is the highest reachable sum <= cap
+def _knapsack_bitset(w, cap):
+    weights=w.tolist()
+    # Subset-sum reachability as an int bitset: bit s set <=> s units reachable
+    mask=(1<<(cap+1))-1
+    reach=1; parent=[]
+    for wi in weights:
+        parent.append(reach)
+        if wi<=0: continue
+        reach|=(reach<<wi)&mask
+
+    chosen=[]; cur=reach.bit_length()-1
+    for i in range(len(weights)-1,-1,-1):
+        if cur<=0: break
+        if (parent[i]>>cur)&1: continue
+        chosen.append(i)
+        cur-=weights[i]
+    chosen.reverse()
+    return np.array(chosen, dtype=np.intp)
+
+def _prepare_items(segs, titles, topics, completed_set, selected_lectures):
+    if not len(segs):
+        return segs
+
+    keep = np.fromiter(((titles[li], topics[li][si]) not in completed_set
+                        for li, si in zip(segs['lec_idx'].tolist(), segs['seg_idx'].tolist())),
+                       dtype=bool, count=len(segs))
 
     if selected_lectures:
-        items = [it for it in items if it['lecture_title'] in selected_lectures]
-
-    if not items:
-        return [], 0.0
-
-    # Soft order-aware inclusion: only recommend higher-order if lower-order is present
-    order_map = defaultdict(list)
-    for it in items:
-        order_map[it['lecture_title']].append(it)
-    filtered_items = []
-    for lec, segs in order_map.items():
-        segs.sort(key=lambda x:x['order'])
-        available_orders = {1}
-        for s in segs:
-            if s['order'] == 1 or s['order'] in available_orders:
-                filtered_items.append(s)
-                available_orders.add(s['order']+1)
-    items = filtered_items
-
-    if not items:
+        selected_idx = [li for li, t in enumerate(titles) if t in selected_lectures]
+        keep &= np.isin(segs['lec_idx'], selected_idx)
+
+    segs = segs[keep]
+    if not len(segs):
+        return segs
+
+    # Soft order-aware inclusion: only recommend higher-order if lower-order is present.
+    # Orders below 1 are never reachable; the rest are admitted while each lecture's
+    # sorted orders start at 1 and step by 0 or 1.
+    segs = segs[segs['order'] >= 1]
+    _, title_key = np.unique(np.array(titles, dtype=str), return_inverse=True)
+    lec_key = title_key[segs['lec_idx']]
+    perm = np.lexsort((segs['order'], lec_key))
+    segs, lec_key = segs[perm], lec_key[perm]
+    order = segs['order']
+    new_lec = np.ones(len(segs), dtype=bool)
+    new_lec[1:] = lec_key[1:] != lec_key[:-1]
+    step = np.diff(order, prepend=0)
+    ok = np.where(new_lec, order == 1, (step == 0) | (step == 1))
+    # Cumulative AND within each lecture: admit until the lecture's first gap
+    breaks = np.cumsum(~ok)
+    starts = np.flatnonzero(new_lec)[np.cumsum(new_lec) - 1]
+    admit = breaks == breaks[starts] - (~ok[starts])
+    return segs[admit]
+
+def recommend_segments(lectures, daily_mins, fatigue_score, completed_set, selected_lectures=None, lectures_rev=None):
+    segs, titles, topics = _flatten_cached(lectures, lectures_rev)
+    segs = _prepare_items(segs, titles, topics, completed_set, selected_lectures)
+    return _solve_knapsack(segs, titles, topics, daily_mins, fatigue_score)
+
+def _solve_knapsack(segs, titles, topics, daily_mins, fatigue_score):
+    if not len(segs):
         return [], 0.0
 
     # Knapsack-style selection based on daily minutes and fatigue
-    total_available_time = sum(it['mins'] for it in items)
+    total_available_time = float(segs['mins'].sum())
     low_u = to_units(daily_mins*0.7)
     high_u = to_units(daily_mins*1.3)
     if fatigue_score>0.6:
@@ -111,45 +266,24 @@ def recommend_segments(lectures, daily_mins, fatigue_score, completed_courses, s
     if fatigue_score>0.8:
         low_u=int(low_u*0.9); high_u=int(high_u*0.7)
     if from_units(low_u)>total_available_time:
-        return items,total_available_time
-
-    scaled = [{'u': to_units(it['mins']), **it} for it in items]
-    cap=min(sum(it['u'] for it in scaled), high_u)
-    dp=[-1]*(cap+1); dp[0]=-2
-    for i,it in enumerate(scaled):
-        w=it['u']
-        if w<=0: continue
-        for s in range(cap,w-1,-1):
-            if dp[s]==-1 and dp[s-w]!=-1:
-                dp[s]=i
-
-    best=-1
-    for s in range(low_u,cap+1):
-        if dp[s]!=-1: best=s
-    if best==-1:
-        for s in range(low_u-1,-1,-1):
-            if dp[s]!=-1: best=s; break
-        if best==-1:
-            for s in range(low_u+1,cap+1):
-                if dp[s]!=-1: best=s; break
-    if best<=0: return [],0.0
-
-    chosen_indices=set(); cur=best
-    while cur>0:
-        i=dp[cur]
-        if i in chosen_indices: break
-        chosen_indices.add(i)
-        cur-=scaled[i]['u']
-
-    chosen=[{'lecture_title':scaled[i]['lecture_title'],
-             'topic':scaled[i]['topic'],
-             'mins':scaled[i]['mins'],
-             'difficulty':scaled[i].get('difficulty',3),
-             'order':scaled[i].get('order',1)} for i in chosen_indices]
+        return segment_records(segs, titles, topics),total_available_time
 
+    total_u=int(segs['u'].sum())
+    # Everything fits in today's budget: the best subset is all of it
+    if 0<total_u<=high_u:
+        return segment_records(segs, titles, topics),total_available_time
+    cap=min(total_u, high_u)
+    chosen_indices=_knapsack_bitset(segs['u'], cap)
+    if not len(chosen_indices): return [],0.0
+
+    chosen=segment_records(segs[chosen_indices], titles, topics)
     return chosen, sum(c['mins'] for c in chosen)
 
 # -------------------- Streamlit UI --------------------
+def segments_frame(segs):
+    return pd.DataFrame([{'Topic':s['topic'],'Min':s['mins'],'Diff':s.get('difficulty',3),'Order':s.get('order',1)}
+                         for s in segs])
+
 st.set_page_config(page_title='Adaptive Micro-Learning', layout='wide')
 st.title('Adaptive Micro-Learning — Fatigue & Soft-Order Aware')
 
@@ -160,11 +294,12 @@ for lec in store.get('lectures',[]):
     for seg in lec.get('segments',[]):
         if 'difficulty' not in seg: seg['difficulty']=3
         if 'order' not in seg: seg['order']=1
-for key in ['completed_courses','recommended_sessions']:
-    if key not in store: store[key]=[]
+if 'recommended_sessions' not in store: store['recommended_sessions']=[]
 if 'recommended_total' not in store: store['recommended_total']=0.0
 if 'streak' not in store:
     store['streak']={'current':0,'last_date':None,'minutes_today':0.0,'last_fatigue':0.0}
+if 'lectures_rev' not in store: touch_lectures(store)
+store.pop('_version',None)
 save_store(store)
 
 # ---------------- Sidebar ----------------
@@ -186,14 +321,18 @@ with st.sidebar:
     st.markdown('---')
     st.header('Quick Actions')
     if st.button("Reset Completed Courses"):
-        store['completed_courses']=[]
+        clear_completed(store)
+        st.session_state['_completed_set']=set()
         store['streak']['minutes_today']=0.0
         store['streak']['last_fatigue']=0.0
         save_store(store)
         st.success("✅ Completed courses reset.")
         st.rerun()
     if st.button("Reset All Data"):
-        store = json.loads(json.dumps(DEFAULT_STORE))
+        store = _default_store()
+        touch_lectures(store)
+        clear_completed(store)
+        st.session_state['_completed_set']=set()
         save_store(store)
         st.success("✅ All data reset.")
         st.rerun()
@@ -207,6 +346,10 @@ with st.sidebar:
 tab1,tab2=st.tabs(["📚 Learning","✅ Completed Courses"])
 
 with tab1:
+    lectures=store['lectures']
+    titles=[lec['title'] for lec in lectures]
+    # First lecture wins on duplicate titles, matching a linear scan
+    title_idx={t:i for i,t in reversed(list(enumerate(titles)))}
     col1,col2 = st.columns([2,3])
     # --- LEFT: Lectures ---
     with col1:
@@ -215,10 +358,11 @@ with tab1:
             st.markdown("### Existing Lectures")
             for li,lec in enumerate(store['lectures']):
                 with st.expander(f"📖 {lec['title']} — {sum(s['mins'] for s in lec.get('segments',[]))} min"):
-                    for seg in lec.get('segments',[]):
-                        st.write(f"- {seg['topic']} ({seg['mins']} min, Diff {seg.get('difficulty',3)}, Order {seg.get('order',1)})")
+                    if lec.get('segments'):
+                        st.dataframe(segments_frame(lec['segments']), hide_index=True)
                     if st.button(f"❌ Delete Lecture", key=f"del_lec_{li}"):
                         store['lectures'].pop(li)
+                        touch_lectures(store)
                         save_store(store)
                         st.rerun()
         else:
@@ -249,6 +393,7 @@ with tab1:
                     st.warning('Need title and at least one buffered segment')
                 else:
                     store['lectures'].append({'title':new_title,'segments':st.session_state['buffer_segments']})
+                    touch_lectures(store)
                     st.session_state['buffer_segments']=[]
                     save_store(store)
                     st.success('Lecture created')
@@ -257,16 +402,16 @@ with tab1:
     # --- RIGHT: Recommendation & Session ---
     with col2:
         st.subheader('Recommendation & Session')
-        main_lectures=[lec['title'] for lec in store['lectures']]
-        selected_lectures=st.multiselect('Select lectures to recommend sessions from', main_lectures)
+        selected_lectures=st.multiselect('Select lectures to recommend sessions from', titles)
 
         if st.button('Recommend Sessions'):
             if not selected_lectures: st.warning("Select at least one lecture")
             else:
                 chosen,total = recommend_segments(store['lectures'], store['settings']['daily_mins'],
                                                   store['streak'].get('last_fatigue',0),
-                                                  store.get('completed_courses',[]),
-                                                  selected_lectures)
+                                                  st.session_state['_completed_set'],
+                                                  selected_lectures,
+                                                  store['lectures_rev'])
                 store['recommended_sessions']=chosen
                 store['recommended_total']=total
                 save_store(store)
@@ -275,20 +420,18 @@ with tab1:
         # Display recommended sessions
         if store.get('recommended_sessions'):
             st.write('Recommended sessions:')
-            grouped=defaultdict(list)
-            for c in store['recommended_sessions']: grouped[c['lecture_title']].append(c)
-            for lec_title,segs in grouped.items():
+            recs=sorted(store['recommended_sessions'], key=itemgetter('lecture_title'))
+            for lec_title,group in groupby(recs, key=itemgetter('lecture_title')):
                 st.markdown(f"### 📖 {lec_title}")
-                segs.sort(key=lambda x:x.get('order',1))
-                for s in segs:
-                    st.write(f"- {s['topic']} ({s['mins']} min, Diff {s.get('difficulty',3)}, Order {s.get('order',1)})")
+                segs=sorted(group, key=lambda x:x.get('order',1))
+                st.dataframe(segments_frame(segs), hide_index=True)
             st.write(f"**Total:** {store.get('recommended_total',0.0):.1f} min")
 
             if 'active_session' not in st.session_state: st.session_state['active_session']=None
             if st.session_state['active_session'] is None:
                 if st.button('Start Recommended Session'):
-                    sess={'segments':[{'lecture_title':c['lecture_title'],'topic':c['topic'],'mins':c['mins'],
-                                       'difficulty':c.get('difficulty',3),'order':c.get('order',1),'done':False}
+                    sess={'segments':[Segment(c['lecture_title'],c['topic'],c['mins'],
+                                              c.get('difficulty',3),c.get('order',1))
                                       for c in store['recommended_sessions']],
                           'started_at':datetime.utcnow().isoformat()}
                     st.session_state['active_session']=sess
@@ -296,22 +439,25 @@ with tab1:
             else:
                 st.write('Active session in progress')
                 for idx,s in enumerate(st.session_state['active_session']['segments']):
-                    chk=st.checkbox(f"{s['lecture_title']} — {s['topic']} ({s['mins']} min)", value=s['done'], key=f'sess_{idx}')
-                    st.session_state['active_session']['segments'][idx]['done']=chk
+                    s.done=st.checkbox(f"{s.lecture_title} — {s.topic} ({s.mins} min)", value=s.done, key=f'sess_{idx}')
                 if st.button('Finish Session'):
-                    completed_today=[s for s in st.session_state['active_session']['segments'] if s['done']]
+                    completed_today=[s for s in st.session_state['active_session']['segments'] if s.done]
                     if not completed_today: st.warning("No courses selected. Session not recorded.")
                     else:
-                        store['completed_courses'].extend([{**s,'completed_on':date.today().isoformat()} for s in completed_today])
-                        minutes_done=sum(s['mins'] for s in completed_today)
-                        avg_diff=sum(s.get('difficulty',3) for s in completed_today)/len(completed_today)
+                        append_completed({**asdict(s),'completed_on':date.today().isoformat()} for s in completed_today)
+                        done_keys={(s.lecture_title,s.topic) for s in completed_today}
+                        st.session_state['_completed_set'].update(done_keys)
+                        minutes_done=sum(s.mins for s in completed_today)
+                        avg_diff=sum(s.difficulty for s in completed_today)/len(completed_today)
                         new_fatigue=store['streak'].get('last_fatigue',0)+compute_fatigue(minutes_done,avg_diff)
                         store['streak']=update_streak(store, minutes_done)
                         store['streak']['last_fatigue']=new_fatigue
-                        remaining=[s for s in store['recommended_sessions']
-                                   if (s['lecture_title'],s['topic']) not in {(c['lecture_title'],c['topic']) for c in completed_today}]
+                        remaining=[]; removed_mins=0.0
+                        for s in store['recommended_sessions']:
+                            if (s['lecture_title'],s['topic']) in done_keys: removed_mins+=s['mins']
+                            else: remaining.append(s)
                         store['recommended_sessions']=remaining
-                        store['recommended_total']=sum(s['mins'] for s in remaining)
+                        store['recommended_total']=store.get('recommended_total',0.0)-removed_mins if remaining else 0.0
                         st.session_state['active_session']=None
                         save_store(store)
                         st.success("✅ Session recorded.")
@@ -319,10 +465,9 @@ with tab1:
         # ---------------- Manual Add Section ----------------
         st.markdown("---")
         st.header("Manually Add Recommended Course")
-        lecture_titles=[lec['title'] for lec in store['lectures']]
-        selected_force_lecture=st.selectbox("Select lecture to force-add", ["--Select--"]+lecture_titles)
+        selected_force_lecture=st.selectbox("Select lecture to force-add", ["--Select--"]+titles)
         if selected_force_lecture!="--Select--":
-            lecture_obj=next(lec for lec in store['lectures'] if lec['title']==selected_force_lecture)
+            lecture_obj=lectures[title_idx[selected_force_lecture]]
             segment_topics=[seg['topic'] for seg in lecture_obj.get('segments',[])]
             selected_force_segments=st.multiselect("Select segments to add to recommended", segment_topics)
             if st.button("Add to Recommended Sessions"):
@@ -331,6 +476,7 @@ with tab1:
                 else:
                     existing_set = {(s['lecture_title'], s['topic']) for s in store['recommended_sessions']}
                     added_count = 0
+                    added_mins = 0.0
                     for seg in lecture_obj['segments']:
                         if seg['topic'] in selected_force_segments:
                             key = (selected_force_lecture, seg['topic'])
@@ -343,8 +489,9 @@ with tab1:
                                     'order': seg.get('order', 1)
                                 })
                                 added_count += 1
+                                added_mins += seg['mins']
                     if added_count > 0:
-                        store['recommended_total'] = sum(s['mins'] for s in store['recommended_sessions'])
+                        store['recommended_total'] = store.get('recommended_total', 0.0) + added_mins
                         save_store(store)
                         st.success(f"{added_count} segment(s) added to recommended sessions.")
                         st.rerun()
@@ -354,9 +501,8 @@ with tab1:
 
 with tab2:
     st.subheader("✅ Completed Courses (All-time)")
-    if not store.get('completed_courses'): st.info("No courses completed yet.")
+    completed_df=pd.DataFrame(completed_records(store), columns=['lecture_title','topic','mins','difficulty','order','completed_on'])
+    if completed_df.empty: st.info("No courses completed yet.")
     else:
-        for c in store['completed_courses']:
-            st.write(f"**{c['lecture_title']}** — {c['topic']} | {c['mins']} min | Diff {c.get('difficulty',3)} | Order {c.get('order',1)} | Done on {c.get('completed_on','—')}")
-
-save_store(store)
+        completed_df=completed_df.fillna({'difficulty':3,'order':1,'completed_on':'—'}).astype({'difficulty':int,'order':int})
+        st.dataframe(completed_df, hide_index=True)